@@ -1,10 +1,14 @@
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 import sys
 from pathlib import Path
 
 SCRIPTS = Path(__file__).parent / "scripts"
 STAGES = ["gate", "plots", "invariants", "verdict", "diagnose", "report"]
+# Stages between gate and report only read the run folder and write their own output,
+# so once gate has passed they run concurrently. report reads their JSON and runs last.
+PARALLEL_STAGES = ["plots", "invariants", "verdict", "diagnose"]
 
 
 def _error_summary(r):
@@ -13,15 +17,36 @@ def _error_summary(r):
     return lines[-1] if lines else f"exit code {r.returncode}"
 
 
-def run_analysis(run_id):
+def run_analysis(run_id, use_cache=True, plot=True):
     run_folder = f"test_runs/flights/{run_id}"
 
-    for stage in STAGES:
-        r = subprocess.run(
-            ["python", str(SCRIPTS / f"{stage}.py"), run_folder],
+    if not use_cache:
+        # Stages share parsed log.csv columns via this cache (flight_data_loader.load_columns)
+        (Path(run_folder) / "analysis" / "log.npz").unlink(missing_ok=True)
+
+    def _run(stage, *extra):
+        return subprocess.run(
+            ["python", str(SCRIPTS / f"{stage}.py"), run_folder, *extra],
             capture_output=True,
             text=True,
         )
+
+    # report reads only the JSON outputs, so plots can be skipped for stats-only runs;
+    # report is told so it does not list figures this run never wrote
+    parallel = [stage for stage in PARALLEL_STAGES if plot or stage != "plots"]
+
+    results = {"gate": _run("gate")}
+    if results["gate"].returncode == 0:
+        with ThreadPoolExecutor(max_workers=len(parallel)) as pool:
+            results.update(zip(parallel, pool.map(_run, parallel)))
+        if all(results[stage].returncode == 0 for stage in parallel):
+            results["report"] = _run("report", *([] if plot else ["--no-plot"]))
+
+    # Output and the reported failure follow STAGES order, as if the stages ran serially
+    for stage in STAGES:
+        r = results.get(stage)
+        if r is None:
+            continue
         sys.stderr.write(r.stdout)
         sys.stderr.write(r.stderr)
         if r.returncode != 0:
@@ -58,9 +83,11 @@ def run_analysis(run_id):
 
 
 def main():
-    if len(sys.argv) != 2:
-        sys.exit("Usage: run.py <run_id>")
-    result = run_analysis(sys.argv[1])
+    flags = {a for a in sys.argv[1:] if a.startswith("--")}
+    args  = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) != 1 or flags - {"--no-cache", "--no-plot"}:
+        sys.exit("Usage: run.py <run_id> [--no-cache] [--no-plot]")
+    result = run_analysis(args[0], use_cache="--no-cache" not in flags, plot="--no-plot" not in flags)
     print(json.dumps(result))
     sys.exit(0 if result["status"] == "completed" else 1)
 
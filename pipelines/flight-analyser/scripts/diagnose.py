@@ -46,7 +46,7 @@ _SPIKE_THRESHOLD_FACTOR = 2.0
 from specification_loader import load_specification                                          # noqa: E402
 from configuration_loader import load_configuration, Configuration                          # noqa: E402
 from flight_data_loader import load_flight, detect_reach_event, detect_hold_window, \
-    FlightData, ReachEvent, HoldWindow                                                       # noqa: E402
+    pearson, FlightData, ReachEvent, HoldWindow                                              # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -292,7 +292,7 @@ def _cycle_timing_stats(fd: FlightData, cfg: Configuration) -> CycleTimingStats:
     nominal   = 1000.0 / cfg.loops.rate.frequency_hz
     threshold = _SPIKE_THRESHOLD_FACTOR * nominal
     spike_mask  = fd.max_dt_ms > threshold
-    spike_count = int(np.sum(spike_mask))
+    spike_count = int(np.count_nonzero(spike_mask))
     spike_interval = None
     if spike_count >= 2:
         spike_times    = fd.t_ms[spike_mask]
@@ -312,29 +312,63 @@ def _cycle_timing_stats(fd: FlightData, cfg: Configuration) -> CycleTimingStats:
     )
 
 
+def _count_outside(x: np.ndarray, limit: float) -> int:
+    """Samples with |x| >= limit, counted from byte-wide masks without an |x| float copy."""
+    return int(np.count_nonzero((x >= limit) | (x <= -limit)))
+
+
+def _quarter_indices(x: np.ndarray, pivot: float, k: int, lowest: bool) -> np.ndarray:
+    """
+    Indices of the k lowest (or highest) values of x, given the k-th value as pivot.
+    Values tied with the pivot are taken in sample order, so the selection matches a
+    stable sort -- encoder velocities are quantised and ties at the quarter edge are common.
+    """
+    strict = np.flatnonzero(x < pivot if lowest else x > pivot)
+    ties   = np.flatnonzero(x == pivot)
+    need   = k - len(strict)
+    ties   = ties[:need] if lowest else ties[len(ties) - need:]
+    return np.concatenate((strict, ties))
+
+
+def _pearson_r(x: np.ndarray, y: np.ndarray) -> float:
+    """Pearson correlation; 0.0 if either series is constant or too short."""
+    r = pearson(x, y)
+    return 0.0 if r is None else r
+
+
 def _sensor_health_stats(fd: FlightData) -> SensorHealthStats:
-    dts      = np.diff(fd.t_ms)
     enc_roll = fd.enc_roll
     imu_roll = fd.imu_roll
+    n        = len(enc_roll)
 
+    # One error buffer serves every reduction: signed sums first, then |error| in place.
     errors     = imu_roll - enc_roll
-    abs_errors = np.abs(errors)
-
-    enc_vel   = np.abs(np.diff(enc_roll)) / (dts / 1000.0)
-    vel_order = np.argsort(enc_vel)
-    quarter   = len(vel_order) // 4
-    slow_idx  = vel_order[:quarter] + 1
-    fast_idx  = vel_order[-quarter:] + 1
+    bias       = float(errors.sum()) / n
+    sq_sum     = float(errors @ errors)
+    abs_errors = np.abs(errors, out=errors)
+
+    enc_vel   = np.diff(enc_roll)
+    np.abs(enc_vel, out=enc_vel)
+    enc_vel  /= np.diff(fd.t_ms) / 1000.0
+    # Only the slowest and fastest quarters are needed, not a full ordering: one
+    # partition with both pivots is O(n).
+    m       = len(enc_vel)
+    quarter = m // 4
+    if quarter > 0:
+        pivots   = np.partition(enc_vel, (quarter - 1, m - quarter))
+        slow_idx = _quarter_indices(enc_vel, pivots[quarter - 1], quarter, lowest=True) + 1
+        fast_idx = _quarter_indices(enc_vel, pivots[m - quarter], quarter, lowest=False) + 1
+    else:
+        slow_idx = fast_idx = np.empty(0, dtype=np.intp)
 
     return SensorHealthStats(
-        mae=float(np.mean(abs_errors)),
-        rms_error=float(np.sqrt(np.mean(errors ** 2))),
-        max_ae=float(np.max(abs_errors)),
-        bias=float(np.mean(errors)),
+        mae=float(abs_errors.sum()) / n,
+        rms_error=float(np.sqrt(sq_sum / n)),
+        max_ae=float(abs_errors.max()),
+        bias=bias,
         mae_fast=float(np.mean(abs_errors[fast_idx])) if len(fast_idx) > 0 else 0.0,
         mae_slow=float(np.mean(abs_errors[slow_idx])) if len(slow_idx) > 0 else 0.0,
-        correlation=float(np.corrcoef(enc_roll, imu_roll)[0, 1])
-                    if np.std(enc_roll) > 0 and np.std(imu_roll) > 0 else 0.0,
+        correlation=_pearson_r(enc_roll, imu_roll),
         enc_range=float(np.ptp(enc_roll)),
         imu_range=float(np.ptp(imu_roll)),
     )
@@ -382,16 +416,12 @@ def _approach_tracking_stats(
     t_ms = fd.t_ms[h_idx:sw_idx]
     err  = enc - setpoint
 
-    pearson_r = 0.0
-    if len(enc) > 1 and np.std(enc) > 0 and np.std(imu) > 0:
-        pearson_r = float(np.corrcoef(enc, imu)[0, 1])
-
     return ApproachTrackingStats(
         bias=float(np.mean(err)),
         std=float(np.std(err)),
         p95=float(np.percentile(np.abs(err), 95)),
         max_ae=float(np.max(np.abs(err))),
-        pearson_r=pearson_r,
+        pearson_r=_pearson_r(enc, imu),
         duration_s=float((t_ms[-1] - t_ms[0]) / 1000.0) if len(t_ms) > 1 else 0.0,
     )
 
@@ -457,11 +487,13 @@ def _inner_loop_stats(fd: FlightData, hi: int) -> InnerLoopStats:
 
 
 def _windup_stats(fd: FlightData, cfg: Configuration) -> WindupStats:
+    ang_thr  = cfg.loops.angle.pid.iterm_limit * 0.5
+    rate_thr = cfg.loops.rate.pid.iterm_limit  * 0.5
     return WindupStats(
-        ang_windup_events=int(np.sum(np.abs(fd.ang_i)  >= cfg.loops.angle.pid.iterm_limit * 0.5)),
-        ang_windup_threshold=cfg.loops.angle.pid.iterm_limit * 0.5,
-        rate_windup_events=int(np.sum(np.abs(fd.rate_i) >= cfg.loops.rate.pid.iterm_limit  * 0.5)),
-        rate_windup_threshold=cfg.loops.rate.pid.iterm_limit  * 0.5,
+        ang_windup_events=_count_outside(fd.ang_i, ang_thr),
+        ang_windup_threshold=ang_thr,
+        rate_windup_events=_count_outside(fd.rate_i, rate_thr),
+        rate_windup_threshold=rate_thr,
     )
 
 
@@ -2,12 +2,15 @@
 Flight telemetry loader for the analyse-flight pipeline.
 
 Provides:
+  load_columns(csv_path)                             -> dict[str, np.ndarray]
   load_flight(csv_path)                              -> FlightData
   detect_reach_event(flight, setpoint, tolerance_deg) -> ReachEvent | None
   detect_hold_window(flight, reach_event, setpoint, tolerance_deg) -> HoldWindow | None
+  first_crossing(x, level, direction)                -> int | None
+  pearson(x, y)                                      -> float | None
 
-FlightData holds all CSV columns converted to numpy arrays; quaternions are
-converted to roll angles in degrees inline.  No config or spec fields are mixed
+FlightData holds all CSV columns as numpy arrays (float32; T_MS float64); quaternions are
+converted to roll angles in degrees once per log.  No config or spec fields are mixed
 in -- those come from configuration_loader / specification_loader.
 
 ReachEvent is present when the encoder entered the tolerance band at least once
@@ -18,12 +21,20 @@ Absence of either object means the respective event did not occur.
 """
 
 import csv
+import os
 import sys
+import warnings
 from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
 
+try:
+    import pyarrow as pa          # optional fast path -- pip install flight-benchy[fast-csv]
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = pacsv = None
+
 
 HOLD_WINDOW_S = 5.0
 
@@ -65,7 +76,8 @@ class FlightData:
     All telemetry columns from one log.csv, loaded by load_flight().
 
     ENC_ROLL is a direct degree value from the CSV. IMU_QR/QI quaternion columns
-    are converted to imu_roll in degrees inline; the raw quaternion values are not stored.
+    are converted to imu_roll in degrees once per log (cached as IMU_ROLL in
+    analysis/log.npz); the raw quaternion values are not stored.
 
     Fields
     ------
@@ -120,58 +132,157 @@ class FlightData:
     max_dt_ms: np.ndarray
 
 
-def load_raw_rows(csv_path: Path) -> list:
-    """Load log.csv as a list of raw string dicts."""
-    with open(csv_path, encoding="utf-8", newline="") as f:
-        return list(csv.DictReader(f))
+_RAD_TO_DEG_X2 = 360.0 / np.pi   # roll = 2 * atan2(qi, qr), in degrees
 
 
 def _quat_to_roll(qr: np.ndarray, qi: np.ndarray) -> np.ndarray:
-    return np.degrees(2.0 * np.arctan2(qi, qr))
+    # One output buffer: scale the atan2 result in place instead of allocating for *2 and degrees()
+    roll = np.arctan2(qi, qr)
+    roll *= _RAD_TO_DEG_X2
+    return roll
+
+
+def _cache_path(csv_path: Path) -> Path:
+    return csv_path.parent / "analysis" / "log.npz"
+
+
+def load_columns(csv_path: Path) -> dict:
+    """
+    Load log.csv as {column name: array}; float32 except the columns in _WIDE_COLUMNS.
+    Includes the derived columns added by _with_derived() (IMU_ROLL).
+
+    All float32 columns are rows of one C-contiguous (n_columns, n_samples) block, so
+    each column is a contiguous view and the whole log is a single allocation.
+
+    Served from analysis/log.npz when that cache is at least as new as log.csv; every
+    pipeline stage loads the same log, so only the first one pays for parsing. Delete
+    the cache (or run the pipeline with --no-cache) to force a re-parse.
+    """
+    names, block, wide = _load_block(csv_path)
+    return {name: wide.get(name, block[i]) for i, name in enumerate(names)}
+
+
+# The Pico logs every signal as a float32 or a small int (recorder._RECORD_FMT), so float32
+# loses nothing and halves the memory traffic of every pass. T_MS is a uint32 millisecond
+# tick: past 2**24 ms (~4.7 h uptime) float32 can no longer hold it exactly, so it stays float64.
+_WIDE_COLUMNS = ("T_MS",)
+
+# Bump when the cached layout changes; older caches are then re-parsed.
+_CACHE_VERSION = 3
+
+
+def _with_derived(names: list, block: np.ndarray) -> tuple[list, np.ndarray]:
+    """
+    Append derived columns to the block so they are computed once per log and cached
+    with the raw ones, rather than recomputed by every stage that loads the flight.
+    IMU_ROLL: roll in degrees from the IMU_QR/IMU_QI quaternion components.
+    """
+    if "IMU_QR" not in names or "IMU_QI" not in names:
+        return names, block
+    roll = _quat_to_roll(block[names.index("IMU_QR")], block[names.index("IMU_QI")])
+    return names + ["IMU_ROLL"], np.vstack((block, roll))
+
+
+def _load_block(csv_path: Path) -> tuple[list, np.ndarray, dict]:
+    cache = _cache_path(csv_path)
+    if cache.exists() and cache.stat().st_mtime >= csv_path.stat().st_mtime:
+        with np.load(cache) as npz:
+            if "version" in npz.files and int(npz["version"]) == _CACHE_VERSION:
+                names = npz["names"].tolist()
+                wide  = {name: npz[f"wide_{name}"] for name in names if name in _WIDE_COLUMNS}
+                return names, npz["block"], wide
+
+    names, block64 = _parse_block(csv_path)
+    wide  = {name: block64[i].copy() for i, name in enumerate(names) if name in _WIDE_COLUMNS}
+    names, block = _with_derived(names, block64.astype(np.float32))
+    if names:
+        cache.parent.mkdir(exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees a half-written cache
+        tmp = cache.with_name(f"{cache.name}.{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, version=_CACHE_VERSION, names=np.array(names), block=block,
+                     **{f"wide_{name}": arr for name, arr in wide.items()})
+        os.replace(tmp, cache)
+    return names, block, wide
+
+
+def _parse_block(csv_path: Path) -> tuple[list, np.ndarray]:
+    """
+    Parse log.csv into (column names, C-contiguous float64 block of shape (n_columns, n)).
+
+    Uses pyarrow's multithreaded CSV reader when it is installed, otherwise reads the
+    header once with csv.reader and parses the body in one np.loadtxt call on the same
+    handle. Either way no per-cell Python float() or per-row dict is built.
+    Returns no names when the file has no header, and n == 0 when it has a header but
+    no rows.
+    """
+    if pacsv is not None:
+        return _parse_block_arrow(csv_path)
+
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        header = next(csv.reader(f), None)
+        if header is None:
+            return [], np.empty((0, 0))
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)   # header-only file: "input contained no data"
+            data = np.loadtxt(f, delimiter=",", dtype=np.float64, ndmin=2)
+    if data.size == 0:
+        return header, np.empty((len(header), 0))
+    return header, np.ascontiguousarray(data.T)
+
+
+def _parse_block_arrow(csv_path: Path) -> tuple[list, np.ndarray]:
+    if csv_path.stat().st_size == 0:
+        return [], np.empty((0, 0))
+    # Parse straight from a memory map: no read() copy of the file into a Python buffer
+    with pa.memory_map(str(csv_path)) as source:
+        table = pacsv.read_csv(source)
+    block = np.empty((table.num_columns, table.num_rows))
+    for i, column in enumerate(table.columns):
+        # Integer-valued columns (M1..M4, DT_MS, ...) arrive as int64; the copy casts them
+        block[i] = column.to_numpy()
+    return table.column_names, block
 
 
 def load_flight(csv_path: Path) -> FlightData:
     """
     Load log.csv and return a FlightData with all columns as numpy arrays.
-    Quaternion columns are converted to roll degrees inline.
+    imu_roll is the cached IMU_ROLL column (see _with_derived).
     Exits immediately if the file is missing or empty.
     """
     if not csv_path.exists():
         sys.exit(f"log.csv not found: {csv_path}")
 
-    rows = load_raw_rows(csv_path)
+    cols = load_columns(csv_path)
 
-    if not rows:
+    if not cols or len(cols["T_MS"]) == 0:
         sys.exit(f"Empty CSV: {csv_path}")
 
-    def col(name: str) -> np.ndarray:
-        return np.array([float(r[name]) for r in rows])
-
     return FlightData(
-        t_ms=col("T_MS"),
-        enc_roll=col("ENC_ROLL"),
-        imu_roll=_quat_to_roll(col("IMU_QR"), col("IMU_QI")),
-        imu_grv_acc=col("IMU_GRV_ACC"),
-        grv_lag_ms=col("GRV_LAG_MS"),
-        gyro_x=col("GYRO_X"),
-        imu_gyro_acc=col("IMU_GYRO_ACC"),
-        gyro_lag_ms=col("GYRO_LAG_MS"),
-        ang_err=col("ANG_ERR"),
-        ang_p=col("ANG_P"),
-        ang_i=col("ANG_I"),
-        ang_d=col("ANG_D"),
-        rate_sp=col("RATE_SP"),
-        rate_err=col("RATE_ERR"),
-        rate_p=col("RATE_P"),
-        rate_i=col("RATE_I"),
-        rate_d=col("RATE_D"),
-        pid_out=col("PID_OUT"),
-        m1=col("M1"),
-        m2=col("M2"),
-        m3=col("M3"),
-        m4=col("M4"),
-        dt_ms=col("DT_MS"),
-        max_dt_ms=col("MAX_DT_MS"),
+        t_ms=cols["T_MS"],
+        enc_roll=cols["ENC_ROLL"],
+        imu_roll=cols["IMU_ROLL"],
+        imu_grv_acc=cols["IMU_GRV_ACC"],
+        grv_lag_ms=cols["GRV_LAG_MS"],
+        gyro_x=cols["GYRO_X"],
+        imu_gyro_acc=cols["IMU_GYRO_ACC"],
+        gyro_lag_ms=cols["GYRO_LAG_MS"],
+        ang_err=cols["ANG_ERR"],
+        ang_p=cols["ANG_P"],
+        ang_i=cols["ANG_I"],
+        ang_d=cols["ANG_D"],
+        rate_sp=cols["RATE_SP"],
+        rate_err=cols["RATE_ERR"],
+        rate_p=cols["RATE_P"],
+        rate_i=cols["RATE_I"],
+        rate_d=cols["RATE_D"],
+        pid_out=cols["PID_OUT"],
+        m1=cols["M1"],
+        m2=cols["M2"],
+        m3=cols["M3"],
+        m4=cols["M4"],
+        dt_ms=cols["DT_MS"],
+        max_dt_ms=cols["MAX_DT_MS"],
     )
 
 
@@ -241,3 +352,30 @@ def detect_hold_window(
         start_time_s=float((t_ms[hold_idx] - t0) / 1000.0),
         duration_s=hold_dur,
     )
+
+
+def first_crossing(x: np.ndarray, level: float, direction: float) -> int | None:
+    """
+    Index of the first sample at or past level, travelling in the sign of direction
+    (x <= level for a negative step, x >= level for a positive one), or None if never.
+    """
+    past = (x <= level) if direction < 0 else (x >= level)
+    i = int(np.argmax(past))
+    return i if past[i] else None
+
+
+def pearson(x: np.ndarray, y: np.ndarray) -> float | None:
+    """
+    Pearson correlation in [-1, 1] from centred dot products, or None when it is undefined
+    (fewer than two samples, a constant series, or non-finite input).  The dot products
+    multiply and accumulate in one BLAS pass; np.corrcoef would build a 2x2 matrix.
+    """
+    if len(x) < 2:
+        return None
+    dx  = x - np.mean(x)
+    dy  = y - np.mean(y)
+    den = np.sqrt(float(dx @ dx) * float(dy @ dy))
+    if not den > 0:
+        return None
+    r = float(dx @ dy) / den
+    return max(-1.0, min(1.0, r)) if np.isfinite(r) else None
@@ -47,13 +47,14 @@ Run from project root:
 """
 
 import json
-import math
 import sys
 from pathlib import Path
 
+import numpy as np
+
 sys.path.insert(0, str(Path(__file__).parent))
 from configuration_loader import load_configuration     # noqa: E402
-from flight_data_loader import load_raw_rows            # noqa: E402
+from flight_data_loader import load_columns             # noqa: E402
 from specification_loader import load_specification      # noqa: E402
 
 # Start-angle tolerance (the expected start angle comes from bench.start_angle_deg in config.json)
@@ -68,9 +69,9 @@ _POWER_CUT_GRAVITY_MARGIN_DEG = 5.0   # if lever is held this far below gravity
 _SAMPLE_RATE_JITTER_FACTOR   = 5.0
 
 
-def check_start_angle(rows, start_angle_deg):
+def check_start_angle(cols, start_angle_deg):
     """Return detail string if the first encoder reading is outside the standard start zone."""
-    first = float(rows[0]["ENC_ROLL"])
+    first = float(cols["ENC_ROLL"][0])
     if abs(first - start_angle_deg) > _START_TOLERANCE_DEG:
         return (
             f"start angle={first:+.1f}deg is outside "
@@ -80,17 +81,17 @@ def check_start_angle(rows, start_angle_deg):
     return None
 
 
-def check_power_cut(rows, setpoint, tolerance_deg, start_angle_deg):
+def check_power_cut(cols, setpoint, tolerance_deg, start_angle_deg):
     """Return detail string on detection, None if clean."""
-    enc   = [float(r["ENC_ROLL"]) for r in rows]
-    diffs = [max(abs(float(r["M2"]) - float(r["M1"])), abs(float(r["M4"]) - float(r["M3"]))) for r in rows]
+    enc   = cols["ENC_ROLL"]
+    diffs = np.maximum(np.abs(cols["M2"] - cols["M1"]), np.abs(cols["M4"] - cols["M3"]))
 
-    if any(abs(a - setpoint) <= tolerance_deg for a in enc):
+    if np.any(np.abs(enc - setpoint) <= tolerance_deg):
         return None
 
-    mean_a    = sum(enc) / len(enc)
-    enc_std   = math.sqrt(sum((a - mean_a) ** 2 for a in enc) / len(enc))
-    mean_diff = sum(diffs) / len(diffs)
+    mean_a    = float(np.mean(enc))
+    enc_std   = float(np.std(enc))
+    mean_diff = float(np.mean(diffs))
 
     if mean_a < start_angle_deg - _POWER_CUT_GRAVITY_MARGIN_DEG:
         return None
@@ -105,15 +106,15 @@ def check_power_cut(rows, setpoint, tolerance_deg, start_angle_deg):
 
 
 
-def check_sample_rate(rows):
+def check_sample_rate(cols):
     """Return detail string if timing jitter is excessive (dt_p99 > 5x median)."""
-    if len(rows) < 10:
+    times = cols["T_MS"]
+    if len(times) < 10:
         return None
-    times = [float(r["T_MS"]) for r in rows]
-    dts   = sorted(times[i + 1] - times[i] for i in range(len(times) - 1))
-    median_dt = dts[len(dts) // 2]
+    dts       = np.sort(np.diff(times))
+    median_dt = float(dts[len(dts) // 2])
     p99_idx   = max(0, int(len(dts) * 0.99) - 1)
-    dt_p99    = dts[p99_idx]
+    dt_p99    = float(dts[p99_idx])
     threshold = _SAMPLE_RATE_JITTER_FACTOR * median_dt
     if dt_p99 > threshold:
         return (
@@ -166,24 +167,25 @@ def main():
     spec     = load_specification(run_dir)
     setpoint = cfg.setpoint_roll_deg
 
-    rows = load_raw_rows(csv_path)
-    if len(rows) < 5:
-        _fail("log-truncated", f"{len(rows)} rows in log.csv; SD write likely interrupted")
+    cols   = load_columns(csv_path)
+    n_rows = len(cols["T_MS"]) if cols else 0
+    if n_rows < 5:
+        _fail("log-truncated", f"{n_rows} rows in log.csv; SD write likely interrupted")
     _pass("log-truncated")
 
     # Identity fields — only reachable when rows >= 5
-    times       = [float(r["T_MS"]) for r in rows]
-    start_angle = float(rows[0]["ENC_ROLL"])
+    times       = cols["T_MS"]
+    start_angle = float(cols["ENC_ROLL"][0])
     result["flight_id"]   = run_dir.name
     result["start_angle"] = round(start_angle, 2)
     result["start_ok"]    = abs(start_angle - cfg.start_angle_deg) <= _START_TOLERANCE_DEG
-    result["duration_s"]  = round((times[-1] - times[0]) / 1000.0, 2)
-    result["n_samples"]   = len(rows)
+    result["duration_s"]  = round(float(times[-1] - times[0]) / 1000.0, 2)
+    result["n_samples"]   = n_rows
 
     for name, detail_fn in [
-        ("start-angle",        lambda: check_start_angle(rows, cfg.start_angle_deg)),
-        ("power-cut",          lambda: check_power_cut(rows, setpoint, spec.tolerance_deg, cfg.start_angle_deg)),
-        ("sample-rate-jitter", lambda: check_sample_rate(rows)),
+        ("start-angle",        lambda: check_start_angle(cols, cfg.start_angle_deg)),
+        ("power-cut",          lambda: check_power_cut(cols, setpoint, spec.tolerance_deg, cfg.start_angle_deg)),
+        ("sample-rate-jitter", lambda: check_sample_rate(cols)),
     ]:
         detail = detail_fn()
         if detail:
@@ -25,6 +25,7 @@ from flight_data_loader import (  # noqa: E402
     load_flight,
     detect_reach_event,
     detect_hold_window,
+    pearson,
 )
 from specification_loader import load_specification  # noqa: E402
 
@@ -83,10 +84,8 @@ def _central_diff(values, times):
 
 
 def _pearson(a, b):
-    if len(a) < 2:
-        return float("nan")
-    v = float(np.corrcoef(a, b)[0, 1])
-    return v if np.isfinite(v) else float("nan")
+    r = pearson(a, b)
+    return float("nan") if r is None else r
 
 
 def _rms(a):
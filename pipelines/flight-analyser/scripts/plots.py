@@ -31,11 +31,13 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.ticker as mticker
-from matplotlib.collections import LineCollection
-from matplotlib.patches import Patch
-from matplotlib.lines import Line2D
+import matplotlib
+matplotlib.use("Agg")   # figures are only ever saved to PNG; skip GUI backend resolution
+import matplotlib.pyplot as plt                    # noqa: E402
+import matplotlib.ticker as mticker                # noqa: E402
+from matplotlib.collections import LineCollection  # noqa: E402
+from matplotlib.patches import Patch               # noqa: E402
+from matplotlib.lines import Line2D                # noqa: E402
 
 sys.path.insert(0, str(Path(__file__).parent))
 
@@ -43,9 +45,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 # orange dots in the plot correspond exactly to the spike_count in diagnose.json.
 _SPIKE_THRESHOLD_FACTOR = 2.0
 
+# Time-series traces longer than this are drawn from a min/max envelope (see _envelope).
+# 20k points is still several per pixel column at 12in x 150dpi.
+_MAX_PLOT_POINTS = 20_000
+
 from specification_loader import load_specification                                           # noqa: E402
 from configuration_loader import load_configuration                                          # noqa: E402
-from flight_data_loader import load_flight, detect_reach_event, detect_hold_window, FlightData, ReachEvent, HoldWindow  # noqa: E402
+from flight_data_loader import load_flight, detect_reach_event, detect_hold_window, first_crossing, \
+    FlightData, ReachEvent, HoldWindow                                                           # noqa: E402
 
 
 # ---------------------------------------------------------------------------
@@ -180,6 +187,28 @@ def _time_formatter(duration_s):
     return None, "Time (s)"
 
 
+def _envelope(t, y, max_points=_MAX_PLOT_POINTS):
+    """
+    Min/max decimation for line plots. Splits the trace into max_points // 2 equal buckets
+    and keeps each bucket's minimum and maximum sample in time order, so spikes and peaks
+    survive where plain striding would drop them. Short traces are returned unchanged.
+    """
+    n = len(y)
+    if n <= max_points:
+        return t, y
+    width     = -(-n // (max_points // 2))
+    n_buckets = -(-n // width)
+    padded    = np.pad(y, (0, n_buckets * width - n), mode="edge").reshape(n_buckets, width)
+    lo        = padded.argmin(axis=1)
+    hi        = padded.argmax(axis=1)
+    base      = np.arange(n_buckets) * width
+    idx       = np.empty(2 * n_buckets, dtype=np.intp)
+    idx[0::2] = base + np.minimum(lo, hi)
+    idx[1::2] = base + np.maximum(lo, hi)
+    np.minimum(idx, n - 1, out=idx)
+    return t[idx], y[idx]
+
+
 # ---------------------------------------------------------------------------
 # Compute layer -- pure (numpy in, dataclass out), no matplotlib
 # ---------------------------------------------------------------------------
@@ -319,17 +348,10 @@ def compute_step_response(
     if abs(initial_step) > 1e-6:
         mark_10 = start_angle + 0.10 * initial_step
         mark_90 = start_angle + 0.90 * initial_step
-        for i, angle in enumerate(enc_roll):
-            if t_10 is None and (
-                    (initial_step < 0 and angle <= mark_10) or
-                    (initial_step > 0 and angle >= mark_10)):
-                t_10 = float(t_s[i])
-            if t_90 is None and (
-                    (initial_step < 0 and angle <= mark_90) or
-                    (initial_step > 0 and angle >= mark_90)):
-                t_90 = float(t_s[i])
-            if t_10 is not None and t_90 is not None:
-                break
+        i_10 = first_crossing(enc_roll, mark_10, initial_step)
+        i_90 = first_crossing(enc_roll, mark_90, initial_step)
+        t_10 = float(t_s[i_10]) if i_10 is not None else None
+        t_90 = float(t_s[i_90]) if i_90 is not None else None
         if t_10 is not None and t_90 is not None:
             rise_time_s = t_90 - t_10
 
@@ -337,12 +359,7 @@ def compute_step_response(
     overshoot_pct = None
     peak_t = peak_angle = None
     if reach_event is not None and abs(initial_step) > 1e-6:
-        crossed_idx = None
-        for i, angle in enumerate(enc_roll):
-            if (initial_step < 0 and angle <= setpoint) or \
-               (initial_step > 0 and angle >= setpoint):
-                crossed_idx = i
-                break
+        crossed_idx = first_crossing(enc_roll, setpoint, initial_step)
         if crossed_idx is not None:
             post     = enc_roll[crossed_idx:]
             peak_idx = int(np.argmin(post) if initial_step < 0 else np.argmax(post))
@@ -423,15 +440,15 @@ def render_timeseries(
                 color="gray", alpha=0.08, zorder=0)
     ax1.axhline(setpoint, color="gray", linewidth=0.8, linestyle="--",
                 label=f"Setpoint ({setpoint:+.0f} deg)")
-    ax1.plot(t_s, fd.enc_roll, label="Encoder", linewidth=0.8)
-    ax1.plot(t_s, fd.imu_roll, label="IMU", linewidth=0.8, alpha=0.6)
+    ax1.plot(*_envelope(t_s, fd.enc_roll), label="Encoder", linewidth=0.8)
+    ax1.plot(*_envelope(t_s, fd.imu_roll), label="IMU", linewidth=0.8, alpha=0.6)
     ax1.set_ylabel("Roll (deg)")
     ax1.set_title("Angle Tracking")
     ax1.grid(True, alpha=0.3)
 
-    ax2.plot(t_s, fd.gyro_x, linewidth=0.6, color="tab:blue",
+    ax2.plot(*_envelope(t_s, fd.gyro_x), linewidth=0.6, color="tab:blue",
              alpha=0.7, label="Gyro X (actual)")
-    ax2.plot(t_s, fd.rate_sp, linewidth=0.8, color="tab:orange",
+    ax2.plot(*_envelope(t_s, fd.rate_sp), linewidth=0.8, color="tab:orange",
              label="Rate setpoint")
     ax2.axhline(0, color="gray", linewidth=0.5, linestyle="--")
     ax2.set_ylabel("Rate (deg/s)")
@@ -439,26 +456,26 @@ def render_timeseries(
     ax2.legend(loc='center left', bbox_to_anchor=(1.01, 0.5), fontsize=8)
     ax2.grid(True, alpha=0.3)
 
-    ax3.plot(t_s, fd.ang_p, label="P", linewidth=0.8, color="tab:blue")
-    ax3.plot(t_s, fd.ang_i, label="I", linewidth=0.8, color="tab:orange")
-    ax3.plot(t_s, fd.ang_d, label="D", linewidth=0.8, color="tab:green")
+    ax3.plot(*_envelope(t_s, fd.ang_p), label="P", linewidth=0.8, color="tab:blue")
+    ax3.plot(*_envelope(t_s, fd.ang_i), label="I", linewidth=0.8, color="tab:orange")
+    ax3.plot(*_envelope(t_s, fd.ang_d), label="D", linewidth=0.8, color="tab:green")
     ax3.set_ylabel("Output (deg/s)")
     ax3.set_title("Angle PID (outer loop)")
     ax3.legend(loc='center left', bbox_to_anchor=(1.01, 0.5), fontsize=8)
     ax3.grid(True, alpha=0.3)
 
-    ax4.plot(t_s, fd.rate_p, label="P", linewidth=0.8, color="tab:blue")
-    ax4.plot(t_s, fd.rate_i, label="I", linewidth=0.8, color="tab:orange")
-    ax4.plot(t_s, fd.rate_d, label="D", linewidth=0.8, color="tab:green")
+    ax4.plot(*_envelope(t_s, fd.rate_p), label="P", linewidth=0.8, color="tab:blue")
+    ax4.plot(*_envelope(t_s, fd.rate_i), label="I", linewidth=0.8, color="tab:orange")
+    ax4.plot(*_envelope(t_s, fd.rate_d), label="D", linewidth=0.8, color="tab:green")
     ax4.set_ylabel("Output (throttle)")
     ax4.set_title("Rate PID (inner loop)")
     ax4.legend(loc='center left', bbox_to_anchor=(1.01, 0.5), fontsize=8)
     ax4.grid(True, alpha=0.3)
 
-    ax5.plot(t_s, fd.m1, label="M1", linewidth=0.8)
-    ax5.plot(t_s, fd.m2, label="M2", linewidth=0.8)
-    ax5.plot(t_s, fd.m3, label="M3", linewidth=0.8, linestyle="--")
-    ax5.plot(t_s, fd.m4, label="M4", linewidth=0.8, linestyle="--")
+    ax5.plot(*_envelope(t_s, fd.m1), label="M1", linewidth=0.8)
+    ax5.plot(*_envelope(t_s, fd.m2), label="M2", linewidth=0.8)
+    ax5.plot(*_envelope(t_s, fd.m3), label="M3", linewidth=0.8, linestyle="--")
+    ax5.plot(*_envelope(t_s, fd.m4), label="M4", linewidth=0.8, linestyle="--")
     ax5.axhline(throttle_max, color="red", linestyle=":", linewidth=0.6, alpha=0.5, zorder=0)
     ax5.axhline(throttle_min, color="red", linestyle=":", linewidth=0.6, alpha=0.5, zorder=0)
     ax5.set_ylabel("Throttle")
@@ -827,7 +844,7 @@ def render_cycle_timing(data: CycleTimingPlotData, label: str) -> "plt.Figure":
     # Bottom: DT_MS histogram — fixed 1ms bins capped at 15ms for cross-run comparability
     HIST_CAP_MS = 15
     bins = np.arange(0, HIST_CAP_MS + 1, 1)  # edges 0..15, 15 bins of 1ms each
-    n_clipped = int(np.sum(dt_ms > HIST_CAP_MS))
+    n_clipped = int(np.count_nonzero(dt_ms > HIST_CAP_MS))
     clip_note = f", {n_clipped} clipped >{HIST_CAP_MS}ms" if n_clipped else ""
     ax_bot.hist(dt_ms[dt_ms <= HIST_CAP_MS], bins=bins, alpha=0.7, color="tab:blue",
                 label=f"DT_MS ({len(dt_ms)} rows{clip_note})")
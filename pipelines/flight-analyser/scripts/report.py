@@ -13,7 +13,7 @@ Writes test_runs/flights/<id>/analysis/summary.md.
 Prerequisites: gate.py, plots.py, verdict.py, and diagnose.py must have already been run.
 
 Usage:
-  python .claude/skills/analyse-flight/scripts/report.py <run_folder>
+  python .claude/skills/analyse-flight/scripts/report.py <run_folder> [--no-plot]
 """
 
 import argparse
@@ -91,7 +91,7 @@ def _iterm_sign_str(effort):
     return "OK" if v else "FLIP - sign error in control chain"
 
 
-def build_report(run_folder_str):
+def build_report(run_folder_str, plots=True):
     run_dir = Path(run_folder_str)
 
     gate    = _load_json(run_dir / "analysis" / "gate.json")
@@ -116,7 +116,13 @@ def build_report(run_folder_str):
     hold_mae  = kpis.get("hold_mae_deg")
     ff_lead   = _fmt(config.feedforward_lead_ms, ".0f") if config.feedforward_lead_ms is not None else "-"
 
-    return Template(_TEMPLATE.read_text(encoding="utf-8")).substitute(
+    template = _TEMPLATE.read_text(encoding="utf-8")
+    if not plots:
+        # Plots is the last section; any PNGs already in analysis/ belong to an earlier run
+        head, heading, _ = template.partition("### Plots\n")
+        template = head + heading + "\nSkipped (--no-plot); PNGs in analysis/, if any, are stale.\n"
+
+    return Template(template).substitute(
         flight_id      = gate["flight_id"],
         duration_s     = _fmt(gate.get("duration_s"), ".1f", " s"),
         n_samples      = str(gate.get("n_samples", "-")),
@@ -205,13 +211,15 @@ def main():
     )
     parser.add_argument("run_folder",
                         help="Path to run folder, e.g. test_runs/flights/2026-05-20_14-30-00")
+    parser.add_argument("--no-plot", action="store_true",
+                        help="plots.py was skipped; replace the Plots section with a note")
     args = parser.parse_args()
 
     run_dir = Path(args.run_folder)
     if not run_dir.is_dir():
         sys.exit(f"Run folder not found: {run_dir}")
 
-    report       = build_report(args.run_folder)
+    report       = build_report(args.run_folder, plots=not args.no_plot)
     analysis_dir = run_dir / "analysis"
     analysis_dir.mkdir(exist_ok=True)
     out_path     = analysis_dir / "summary.md"
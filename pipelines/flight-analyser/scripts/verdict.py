@@ -49,7 +49,8 @@ import numpy as np
 sys.path.insert(0, str(Path(__file__).parent))
 from specification_loader import load_specification                          # noqa: E402
 from configuration_loader import load_configuration                         # noqa: E402
-from flight_data_loader import load_flight, detect_reach_event, detect_hold_window  # noqa: E402
+from flight_data_loader import load_flight, detect_reach_event, detect_hold_window, \
+    first_crossing                                                                # noqa: E402
 
 
 def main():
@@ -79,29 +80,17 @@ def main():
     if initial_step_abs > 1e-6:
         mark_10 = start_angle + 0.10 * initial_step
         mark_90 = start_angle + 0.90 * initial_step
-        t_10 = t_90 = None
-        for i in range(len(enc)):
-            a = float(enc[i])
-            if t_10 is None:
-                if (initial_step < 0 and a <= mark_10) or (initial_step > 0 and a >= mark_10):
-                    t_10 = float(t_ms[i])
-            if t_90 is None:
-                if (initial_step < 0 and a <= mark_90) or (initial_step > 0 and a >= mark_90):
-                    t_90 = float(t_ms[i])
-            if t_10 is not None and t_90 is not None:
-                break
+        i_10 = first_crossing(enc, mark_10, initial_step)
+        i_90 = first_crossing(enc, mark_90, initial_step)
+        t_10 = float(t_ms[i_10]) if i_10 is not None else None
+        t_90 = float(t_ms[i_90]) if i_90 is not None else None
         if t_10 is not None and t_90 is not None:
             rise_time_s = (t_90 - t_10) / 1000.0
 
     # --- Overshoot (max excursion past setpoint after first crossing) ---
     overshoot_pct = None
     if reach_w is not None and initial_step_abs > 1e-6:
-        crossed_idx = None
-        for i in range(len(enc)):
-            a = float(enc[i])
-            if (initial_step < 0 and a <= setpoint) or (initial_step > 0 and a >= setpoint):
-                crossed_idx = i
-                break
+        crossed_idx = first_crossing(enc, setpoint, initial_step)
         if crossed_idx is not None:
             post    = enc[crossed_idx:]
             max_exc = float(
@@ -1,4 +1,9 @@
-from math import degrees, atan2
+from math import atan2, pi
+
+try:
+    import micropython
+except ImportError:  # CPython: SIL tests run core/ on the desktop
+    import core.emitters as micropython
 
 from core.pid import PID
 from core.mixer import LeverMixer
@@ -53,6 +58,12 @@ class ControlCore:
         self._err_sign   = int(signs["err_sign"])
         self._mixer_sign = int(signs["mixer_sign"])
 
+        # Sign and unit factors folded into one multiplier each, so step() pays a single
+        # float multiply per term instead of re-deriving them every cycle.
+        self._gyro_scale = self._gyro_sign * self._imu_sign * (180.0 / pi)  # rad/s -> signed deg/s
+        self._roll_scale = self._imu_sign * (360.0 / pi)                    # atan2 -> signed roll deg
+        self._ff_gain    = self._ff_sign * self._lead_s                     # deg/s -> lead deg
+
         rate_output_limit = rpid_cfg.get("output_limit")
         if rate_output_limit is not None:
             assert_motor_range(
@@ -66,6 +77,8 @@ class ControlCore:
             kd=apid_cfg["kd"],
             iterm_limit=apid_cfg["iterm_limit"],
             output_limit=apid_cfg["output_limit"],
+            d_cutoff_hz=apid_cfg.get("d_cutoff_hz"),
+            dt_nominal=self.outer_period_s,
         )
         self.rate_pid = PID(
             kp=rpid_cfg["kp"],
@@ -73,6 +86,8 @@ class ControlCore:
             kd=rpid_cfg["kd"],
             iterm_limit=rpid_cfg["iterm_limit"],
             output_limit=rpid_cfg["output_limit"],
+            d_cutoff_hz=rpid_cfg.get("d_cutoff_hz"),
+            dt_nominal=1.0 / rate_hz,
         )
         self.mixer = LeverMixer(
             throttle_base=motor_cfg["base_throttle"],
@@ -84,6 +99,12 @@ class ControlCore:
         self._outer_counter = 0
         self._rate_setpoint = 0.0
 
+        # GRV roll cache: atan2 is skipped when an outer tick sees the same quaternion
+        # as the previous one (GRV and angle loop both nominally 100 Hz, but not phase-locked)
+        self._roll_iqr = None
+        self._roll_iqi = None
+        self._imu_roll = 0.0
+
         # Post-step telemetry state (updated before step() returns)
         self.last_gyro_x        = 0.0
         self.last_ang_err       = 0.0
@@ -92,6 +113,7 @@ class ControlCore:
         self.last_output        = 0.0
         self.last_is_outer      = False
 
+    @micropython.native
     def step(self, iqr, iqi, iqj, iqk, raw_gx_rad, dt_s):
         """One control cycle. Returns (m1, m2, m3, m4) throttle commands.
 
@@ -100,15 +122,21 @@ class ControlCore:
         dt_s : elapsed seconds since last call
 
         All last_* attributes are updated before returning.
+        Compiled with the native emitter: this is the whole IMU -> PID -> mixer path,
+        run once per inner cycle.
         """
-        gyro_x = self._gyro_sign * self._imu_sign * degrees(raw_gx_rad)
+        gyro_x = self._gyro_scale * raw_gx_rad
 
         self._outer_counter += 1
         is_outer = self._outer_counter >= self._outer_ticks
         if is_outer:
             self._outer_counter = 0
-            imu_roll = self._imu_sign * degrees(2.0 * atan2(iqi, iqr))
-            feedforward_roll = (imu_roll + self._ff_sign * gyro_x * self._lead_s) - self._setpoint
+            if iqr != self._roll_iqr or iqi != self._roll_iqi:
+                self._imu_roll = self._roll_scale * atan2(iqi, iqr)
+                self._roll_iqr = iqr
+                self._roll_iqi = iqi
+            imu_roll = self._imu_roll
+            feedforward_roll = (imu_roll + self._ff_gain * gyro_x) - self._setpoint
             ang_err = self._err_sign * feedforward_roll
             self.last_ang_err = ang_err
             self._rate_setpoint = self.angle_pid.compute(ang_err, self.outer_period_s)
@@ -0,0 +1,15 @@
+"""Desktop stand-ins for MicroPython's code-emitter decorators.
+
+On the Pico, ``@micropython.native`` / ``@micropython.viper`` are compile-time directives
+handled by the MicroPython compiler. CPython has no ``micropython`` module, so core/ files
+fall back to this one and the decorators become identity functions -- SIL tests run the
+same source as the firmware. Not deployed: the Pico never imports it.
+"""
+
+
+def native(f):
+    return f
+
+
+def viper(f):
+    return f
@@ -1,10 +1,31 @@
+try:
+    import micropython
+except ImportError:  # CPython: SIL tests run core/ on the desktop
+    import core.emitters as micropython
+
+
+@micropython.viper
+def _mix(p: int, base: int, lo: int, hi: int) -> int:
+    """Differential mix and clamp in native integer arithmetic.
+
+    Returns m1 in the high 16 bits and m2 in the low 16 bits: a viper function returns
+    a single machine int, so packing avoids allocating a result tuple.
+    """
+    m1 = base - p
+    m2 = base + p
+    m1 = hi if m1 > hi else (lo if m1 < lo else m1)
+    m2 = hi if m2 > hi else (lo if m2 < lo else m2)
+    return (m1 << 16) | (m2 & 0xFFFF)
+
+
 class LeverMixer:
     """Differential thrust mixer for a 4-motor lever (2 motors per end)."""
 
     def __init__(self, throttle_base, throttle_min, throttle_max):
-        self.throttle_base = throttle_base
-        self.throttle_min = throttle_min
-        self.throttle_max = throttle_max
+        # int() up front: viper _mix() rejects float arguments
+        self.throttle_base = int(throttle_base)
+        self.throttle_min = int(throttle_min)
+        self.throttle_max = int(throttle_max)
 
     def compute(self, pid_output):
         """Return (m1, m2, m3, m4) throttle values, clamped to limits.
@@ -12,9 +33,7 @@ class LeverMixer:
         M3 is co-located with M1 (same lever end); M4 is co-located with M2.
         Both pairs receive identical signals.
         """
-        m1 = self.throttle_base - int(pid_output)
-        m2 = self.throttle_base + int(pid_output)
-
-        m1 = max(self.throttle_min, min(self.throttle_max, m1))
-        m2 = max(self.throttle_min, min(self.throttle_max, m2))
+        packed = _mix(int(pid_output), self.throttle_base, self.throttle_min, self.throttle_max)
+        m1 = packed >> 16
+        m2 = packed & 0xFFFF
         return m1, m2, m1, m2
@@ -1,20 +1,42 @@
+from math import pi
+
+try:
+    import micropython
+except ImportError:  # CPython: SIL tests run core/ on the desktop
+    import core.emitters as micropython
+
+
 class PID:
     """Discrete PID controller with anti-windup and term introspection."""
 
-    def __init__(self, kp, ki, kd=0.0, iterm_limit=200.0, output_limit=None):
-        """Configure gains and integral windup limit."""
+    def __init__(self, kp, ki, kd=0.0, iterm_limit=200.0, output_limit=None,
+                 d_cutoff_hz=None, dt_nominal=None):
+        """Configure gains, integral windup limit and optional derivative filter.
+
+        d_cutoff_hz: if set, the raw derivative is passed through a one-pole low-pass
+        (EMA) with this cutoff before kd is applied. The smoothing factor is fixed from
+        dt_nominal (the loop period, required with d_cutoff_hz) so compute() pays one
+        multiply-add instead of re-deriving it from the measured dt each call.
+        """
         self.kp = kp
         self.ki = ki
         self.kd = kd
         self.iterm_limit = iterm_limit
         self.output_limit = output_limit
+        if d_cutoff_hz:
+            wdt = 2.0 * pi * d_cutoff_hz * dt_nominal
+            self._d_alpha = wdt / (wdt + 1.0)
+        else:
+            self._d_alpha = None
         self._integral = 0.0
         self._prev_error = 0.0
         self._prev_measurement = None
+        self._d_filtered = 0.0
         self.last_p = 0.0
         self.last_i = 0.0
         self.last_d = 0.0
 
+    @micropython.native
     def compute(self, error, dt, measurement=None):
         """Return PID output for given error and timestep. Updates last_p/last_i/last_d.
 
@@ -22,30 +44,42 @@ class PID:
         derivative) instead of d(error)/dt. This avoids derivative kick when the setpoint
         changes, which matters for the inner rate loop when rate_setpoint steps each outer tick.
         On the first call after reset, D is zero regardless.
+
+        Compiled with the native emitter as a method rather than split into a free
+        step function: a tuple return would allocate on every call.
         """
-        if self.ki:
-            self._integral += error * dt
-        if self._integral > self.iterm_limit:
-            self._integral = self.iterm_limit
-        elif self._integral < -self.iterm_limit:
-            self._integral = -self.iterm_limit
+        ki  = self.ki
+        lim = self.iterm_limit
+        integral = self._integral + error * dt if ki else self._integral
+        integral = lim if integral > lim else (-lim if integral < -lim else integral)
+        self._integral = integral
 
         if measurement is not None:
-            if self._prev_measurement is None:
+            prev = self._prev_measurement
+            if prev is None:
                 derivative = 0.0
             else:
-                derivative = -(measurement - self._prev_measurement) / dt if dt > 0 else 0.0
+                derivative = -(measurement - prev) / dt if dt > 0 else 0.0
             self._prev_measurement = measurement
         else:
             derivative = (error - self._prev_error) / dt if dt > 0 else 0.0
         self._prev_error = error
 
-        self.last_p = self.kp * error
-        self.last_i = self.ki * self._integral
-        self.last_d = self.kd * derivative
-        output = self.last_p + self.last_i + self.last_d
-        if self.output_limit is not None:
-            output = max(-self.output_limit, min(output, self.output_limit))
+        alpha = self._d_alpha
+        if alpha is not None:
+            derivative = self._d_filtered + alpha * (derivative - self._d_filtered)
+            self._d_filtered = derivative
+
+        p = self.kp * error
+        i = ki * integral
+        d = self.kd * derivative
+        self.last_p = p
+        self.last_i = i
+        self.last_d = d
+        output = p + i + d
+        out_lim = self.output_limit
+        if out_lim is not None:
+            output = out_lim if output > out_lim else (-out_lim if output < -out_lim else output)
         return output
 
     def reset(self):
@@ -53,3 +87,4 @@ class PID:
         self._integral = 0.0
         self._prev_error = 0.0
         self._prev_measurement = None
+        self._d_filtered = 0.0
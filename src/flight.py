@@ -41,6 +41,11 @@ PIN_SD_MOSI    = const(19)
 # Constants
 # =====================================================
 MS_PER_S          = const(1000)  # milliseconds per second — used for ms<->s conversions throughout
+US_PER_S          = const(1_000_000)  # microseconds per second — PID dt is measured in us
+
+# Bus 0 stays at Fast-mode. AS5600 and PCF8523 accept 1 MHz Fast-mode Plus, but the BNO085
+# is specified to 400 kHz only and shares the bus, so FM+ would need it moved to bus 1.
+I2C0_FREQ_HZ      = const(400_000)
 
 GC_INTERVAL_MS     = const(800)   # minimum gap between gc.collect() calls in the control loop
 IMU_POLL_US        = const(500)   # yield when update_sensors() returns 0 (no new IMU data)
@@ -52,7 +57,7 @@ SENSOR_COH_THRESHOLD    = const(300) # coherence accumulator trip value (positiv
 # =====================================================
 # Hardware
 # =====================================================
-i2c = I2C(0, scl=Pin(PIN_I2C0_SCL), sda=Pin(PIN_I2C0_SDA), freq=400_000)
+i2c = I2C(0, scl=Pin(PIN_I2C0_SCL), sda=Pin(PIN_I2C0_SDA), freq=I2C0_FREQ_HZ)
 encoder = AS5600(i2c=i2c)
 
 def load_config():
@@ -62,8 +67,8 @@ def load_config():
 # =====================================================
 # Time conversion helpers
 # =====================================================
-def ms_to_s(ms):
-    return ms / MS_PER_S
+def us_to_s(us):
+    return us / US_PER_S
 
 def s_to_ms(s):
     return int(s * MS_PER_S)
@@ -219,6 +224,7 @@ def stabilize(core, motors, telemetry, imu, cfg, duration_ms=None):
 
     imu.update_sensors()  # flush initial packets
     run_start_ms  = utime.ticks_ms()
+    prev_us       = utime.ticks_us()
     prev_ms       = run_start_ms
     last_gc_ms    = run_start_ms
     last_gyro_ts  = 0.0  # sentinel; first real gyro packet (sensor_ts_ms > 0) always looks new
@@ -227,6 +233,11 @@ def stabilize(core, motors, telemetry, imu, cfg, duration_ms=None):
     ctrl_dir   = FuseControlDirection(core.angle_pid.output_limit, CTRL_DIR_TRIP_TICKS)
     sensor_coh = FuseSensorCoherence(SENSOR_COH_WARMUP_TICKS, SENSOR_COH_THRESHOLD)
 
+    # Loop-invariant objects bound to locals: a local load is one bytecode, an attribute
+    # chain is a dict lookup per dot, paid every inner cycle
+    angle_pid = core.angle_pid
+    rate_pid  = core.rate_pid
+
     while True:
         if duration_ms is not None and utime.ticks_diff(utime.ticks_ms(), run_start_ms) >= duration_ms:
             break
@@ -241,9 +252,16 @@ def stabilize(core, motors, telemetry, imu, cfg, duration_ms=None):
             imu_stale.check()  # packet arrived but no new gyro — still enforce staleness
             continue
 
+        # dt from the us timer: at 300 Hz a ms tick quantises the 3.33 ms period to 3 or 4 ms,
+        # a +/-20% error fed straight into the rate PID's I and D terms
+        now_us = utime.ticks_us()
         now_ms = utime.ticks_ms()
         imu_stale.update(g.host_ts_ms)
         last_gyro_ts = g.sensor_ts_ms
+        dt_us  = utime.ticks_diff(now_us, prev_us)
+        prev_us = now_us
+        # Telemetry DT_MS / MAX_DT_MS stay a ms-tick diff: per-cycle values are 3 or 4 at
+        # 300 Hz but sum to the true elapsed time, so their mean is exact (dt_us // 1000 is not)
         dt_ms  = utime.ticks_diff(now_ms, prev_ms)
         prev_ms = now_ms
 
@@ -253,24 +271,29 @@ def stabilize(core, motors, telemetry, imu, cfg, duration_ms=None):
         grv_lag_ms  = imu.bno_start_diff(grv.host_ts_ms) - grv.sensor_ts_ms
         gyro_lag_ms = imu.bno_start_diff(g.host_ts_ms)   - g.sensor_ts_ms
 
-        m1, m2, m3, m4 = core.step(iqr, iqi, iqj, iqk, gx, ms_to_s(dt_ms))
+        m1, m2, m3, m4 = core.step(iqr, iqi, iqj, iqk, gx, us_to_s(dt_us))
         motors.setAllThrottles([m1, m2, m3, m4])
 
-        enc_angle = enc_sign * to_degrees(encoder.read_raw_angle(), axis_center)
-
-        telemetry.record(
-            now_ms, dt_ms,
-            enc_angle,
-            iqr, iqi, iqj, iqk, grv.accuracy, grv_lag_ms,
-            core.last_gyro_x, g.accuracy, gyro_lag_ms,
-            core.last_ang_err,
-            core.angle_pid.last_p, core.angle_pid.last_i, core.angle_pid.last_d,
-            core.last_rate_setpoint,
-            core.last_rate_error, core.rate_pid.last_p, core.rate_pid.last_i, core.rate_pid.last_d,
-            core.last_output, m1, m2, m3, m4,
-        )
-
-        if core.last_is_outer:
+        # Encoder is telemetry/fuse-only: read it on cycles that consume it, not every cycle
+        record_due = telemetry.tick(dt_ms)
+        is_outer   = core.last_is_outer
+        if record_due or is_outer:
+            enc_angle = enc_sign * to_degrees(encoder.read_raw_angle(), axis_center)
+
+        if record_due:
+            telemetry.record(
+                now_ms, dt_ms,
+                enc_angle,
+                iqr, iqi, iqj, iqk, grv.accuracy, grv_lag_ms,
+                core.last_gyro_x, g.accuracy, gyro_lag_ms,
+                core.last_ang_err,
+                angle_pid.last_p, angle_pid.last_i, angle_pid.last_d,
+                core.last_rate_setpoint,
+                core.last_rate_error, rate_pid.last_p, rate_pid.last_i, rate_pid.last_d,
+                core.last_output, m1, m2, m3, m4,
+            )
+
+        if is_outer:
             if utime.ticks_diff(now_ms, last_gc_ms) >= GC_INTERVAL_MS:
                 gc.collect()
                 last_gc_ms = now_ms
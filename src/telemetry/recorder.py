@@ -8,9 +8,11 @@ import sdcard
 _SD_MOUNT    = "/sd"
 _LOG_DIR     = _SD_MOUNT + "/flights"
 _SECTOR      = 512
+_WRITE_BUF   = 4 * _SECTOR  # flush 4 sectors per f.write(): 4x fewer flushes, lets FatFs use CMD25
 _FILL_CHUNK  = b'\x00' * _SECTOR
 _RECORD_FMT  = "<I20fHHHHHH"
 _RECORD_SIZE = struct.calcsize(_RECORD_FMT)
+_pack_into   = struct.pack_into  # one global lookup per record instead of global + attribute
 
 
 class SdSink:
@@ -36,9 +38,9 @@ class SdSink:
         os.mount(self._vfs, _SD_MOUNT)
 
         self._preallocate_bytes = preallocate_bytes
-        self._write_buf = bytearray(_SECTOR) if preallocate_bytes > 0 else None
+        self._write_buf = bytearray(_WRITE_BUF)
         self._buf_pos  = 0  # bytes used in _write_buf
-        self._file_pos = 0  # bytes written to file (full sectors only)
+        self._file_pos = 0  # bytes written to file (whole _write_buf blocks only)
         self._run_dir = None
         self._f = None
 
@@ -92,27 +94,40 @@ class SdSink:
         return self._run_dir
 
     def write_bytes(self, data):
-        """Append a binary record to the log file."""
+        """Append a binary record to the log file.
+
+        Records accumulate in _write_buf and reach the file only as whole
+        _WRITE_BUF blocks, sector-aligned, in both preallocated and plain mode.
+        """
+        n   = len(data)
+        pos = self._buf_pos
+        buf = self._write_buf
         if self._preallocate_bytes > 0:
-            if self._file_pos + self._buf_pos + len(data) > self._preallocate_bytes:
+            if self._file_pos + pos + n > self._preallocate_bytes:
                 raise OSError("telemetry overflow: preallocate_bytes exceeded")
-            di = 0
-            while di < len(data):
-                take = min(_SECTOR - self._buf_pos, len(data) - di)
-                self._write_buf[self._buf_pos:self._buf_pos + take] = data[di:di + take]
-                self._buf_pos += take
-                di += take
-                if self._buf_pos == _SECTOR:
-                    self._f.write(self._write_buf)
-                    self._file_pos += _SECTOR
-                    self._buf_pos = 0
-        else:
-            self._f.write(data)
+        if pos + n < _WRITE_BUF:
+            buf[pos:pos + n] = data  # common case: whole record fits, no temporaries
+            self._buf_pos = pos + n
+            return
+        # Record straddles a block boundary (about 1 in 21): split it through a memoryview
+        # so the pieces are views into data, not sliced copies
+        mv = memoryview(data)
+        di = 0
+        while di < n:
+            take = min(_WRITE_BUF - pos, n - di)
+            buf[pos:pos + take] = mv[di:di + take]
+            pos += take
+            di += take
+            if pos == _WRITE_BUF:
+                self._f.write(buf)
+                self._file_pos += _WRITE_BUF
+                pos = 0
+        self._buf_pos = pos
 
     def flush(self):
-        """Flush FatFs sector buffer to SD card.  Note: in prealloc mode the
-        Python-level write buffer (_write_buf) is NOT flushed here; call
-        close() for full durability."""
+        """Flush FatFs sector buffer to SD card.  Note: the Python-level
+        write buffer (_write_buf) is NOT flushed here; call close() for
+        full durability."""
         self._f.flush()
 
     def write_crash_log(self, exc):
@@ -142,7 +157,7 @@ class SdSink:
         """Flush and close the log file, then unmount the SD card."""
         if self._f:
             actual_bytes = self._file_pos
-            if self._write_buf is not None and self._buf_pos > 0:
+            if self._buf_pos > 0:
                 self._f.write(memoryview(self._write_buf)[:self._buf_pos])
                 actual_bytes += self._buf_pos
             self._f.flush()
@@ -157,7 +172,11 @@ class SdSink:
 
 
 class TelemetryRecorder:
-    """Facade that decimates and writes binary telemetry records, delegating I/O to a sink.
+    """Facade that writes binary telemetry records, delegating I/O to a sink.
+
+    Decimation is the caller's job: call tick(dt_ms) every control cycle and call
+    record() only when it returns True (stabilize() in flight.py is the one caller).
+    record() packs unconditionally, so an ungated caller logs every cycle.
 
     Records are packed via struct.pack_into into a pre-allocated bytearray with zero
     heap allocation per record. pull_flights.py decodes log.bin -> log.csv on the PC.
@@ -167,6 +186,7 @@ class TelemetryRecorder:
     def __init__(self, sample_every, sink):
         self._sample_every = sample_every
         self._sink = sink
+        self._write = sink.write_bytes  # bound once; record() runs at 300/sample_every Hz
         self._counter = 0
         self._max_dt_ms = 0
         self._pack_buf = bytearray(_RECORD_SIZE)
@@ -176,29 +196,39 @@ class TelemetryRecorder:
         self._counter = 0
         self._max_dt_ms = 0
 
+    def tick(self, dt_ms):
+        """Account one control cycle. Returns True when this cycle's record is due.
+
+        Called every cycle so MAX_DT_MS covers the whole sample_every window; the caller
+        gathers the record fields (including the encoder read) only when this returns True.
+        """
+        if dt_ms > self._max_dt_ms:
+            self._max_dt_ms = dt_ms
+        c = self._counter + 1
+        if c < self._sample_every:
+            self._counter = c
+            return False
+        self._counter = 0
+        return True
+
     def record(self, t_ms, dt_ms, enc_roll,
                iqr, iqi, iqj, iqk, grv_acc, grv_lag_ms,
                gyro_x, gyro_acc, gyro_lag_ms,
                ang_err, ang_p, ang_i, ang_d, rate_sp,
                rate_err, rate_p, rate_i, rate_d, pid_out, m1, m2, m3, m4):
-        """Pack and emit a binary record every sample_every-th call. Others are silently dropped."""
-        if dt_ms > self._max_dt_ms:
-            self._max_dt_ms = dt_ms
-        self._counter += 1
-        if self._counter < self._sample_every:
-            return
-        self._counter = 0
+        """Pack and emit one binary record. Call only on cycles where tick() returned True."""
         max_dt = self._max_dt_ms
         self._max_dt_ms = 0
 
-        struct.pack_into(_RECORD_FMT, self._pack_buf, 0,
+        buf = self._pack_buf
+        _pack_into(_RECORD_FMT, buf, 0,
             t_ms, enc_roll,
             iqr, iqi, iqj, iqk, grv_acc, grv_lag_ms,
             gyro_x, gyro_acc, gyro_lag_ms,
             ang_err, ang_p, ang_i, ang_d, rate_sp,
             rate_err, rate_p, rate_i, rate_d, pid_out,
             m1, m2, m3, m4, dt_ms, max_dt)
-        self._sink.write_bytes(self._pack_buf)
+        self._write(buf)
 
     def write_crash_log(self, exc):
         """Write exception traceback to the session folder via the sink."""
@@ -48,6 +48,8 @@ class SDCard:
         for i in range(512):
             self.dummybuf[i] = 0xFF
         self.dummybuf_memoryview = memoryview(self.dummybuf)
+        # card still programming the last written block; polled before the next command
+        self._busy = False
 
         # initialise the card
         self.init_card(baudrate)
@@ -143,7 +145,21 @@ class SDCard:
                 return
         raise OSError("timeout waiting for v2 card")
 
+    def _wait_ready(self):
+        # Deferred end-of-write busy wait: the card holds DO low while it programs flash.
+        # Waiting here rather than at the end of write() lets the caller return while the
+        # card finishes; the wait is only paid if another command follows before it is done.
+        self.cs(0)
+        self.spi.readinto(self.tokenbuf, 0xFF)
+        while self.tokenbuf[0] == 0:
+            self.spi.readinto(self.tokenbuf, 0xFF)
+        self.cs(1)
+        self.spi.write(b"\xff")
+        self._busy = False
+
     def cmd(self, cmd, arg, crc, final=0, release=True, skip1=False):
+        if self._busy:
+            self._wait_ready()
         self.cs(0)
 
         # create and send the command
@@ -207,35 +223,41 @@ class SDCard:
         self.cs(1)
         self.spi.write(b"\xff")
 
-    def write(self, token, buf):
+    def write(self, token, buf, wait=True):
+        # tokenbuf is reused for every single-byte transfer: spi.read(1, ...) would
+        # allocate a fresh bytes object per token and per busy-poll iteration
         self.cs(0)
 
         # send: start of block, data, checksum
-        self.spi.read(1, token)
+        self.spi.readinto(self.tokenbuf, token)
         self.spi.write(buf)
         self.spi.write(b"\xff")
         self.spi.write(b"\xff")
 
         # check the response
-        if (self.spi.read(1, 0xFF)[0] & 0x1F) != 0x05:
+        self.spi.readinto(self.tokenbuf, 0xFF)
+        if (self.tokenbuf[0] & 0x1F) != 0x05:
             self.cs(1)
             self.spi.write(b"\xff")
             return
 
-        # wait for write to finish
-        while self.spi.read(1, 0xFF)[0] == 0:
-            pass
+        if wait:
+            # wait for write to finish
+            self.spi.readinto(self.tokenbuf, 0xFF)
+            while self.tokenbuf[0] == 0:
+                self.spi.readinto(self.tokenbuf, 0xFF)
+        else:
+            self._busy = True
 
         self.cs(1)
         self.spi.write(b"\xff")
 
     def write_token(self, token):
         self.cs(0)
-        self.spi.read(1, token)
+        self.spi.readinto(self.tokenbuf, token)
         self.spi.write(b"\xff")
-        # wait for write to finish
-        while self.spi.read(1, 0xFF)[0] == 0x00:
-            pass
+        # card is now programming the final block; _wait_ready() polls before the next command
+        self._busy = True
 
         self.cs(1)
         self.spi.write(b"\xff")
@@ -284,7 +306,7 @@ class SDCard:
                 raise OSError(5)  # EIO
 
             # send the data
-            self.write(_TOKEN_DATA, buf)
+            self.write(_TOKEN_DATA, buf, wait=False)
         else:
             # CMD25: set write address for first block
             if self.cmd(25, block_num * self.cdv, 0) != 0:
@@ -299,6 +321,10 @@ class SDCard:
             self.write_token(_TOKEN_STOP_TRAN)
 
     def ioctl(self, op, arg):
+        if op == 3:  # sync: finish any deferred block programming
+            if self._busy:
+                self._wait_ready()
+            return 0
         if op == 4:  # get number of blocks
             return self.sectors
         if op == 5:  # get block size in bytes
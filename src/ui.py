@@ -3,7 +3,7 @@
 # Buttons (GPIO 12–15) and RGB LED (GPIO 6/7/8) from the Display Pack are used.
 # LCD is physically disconnected (SPI0 conflict with Adalogger SD card, see DR-004).
 
-from machine import Pin
+from machine import Pin, idle
 from micropython import const
 import utime
 
@@ -18,14 +18,43 @@ PIN_BTN_B = const(13)
 PIN_BTN_X = const(14)
 PIN_BTN_Y = const(15)
 
+BTN_DEBOUNCE_MS = const(15)  # pin must read released this long before a press ends
+
 led_r = Pin(PIN_LED_R, Pin.OUT)
 led_g = Pin(PIN_LED_G, Pin.OUT)
 led_b = Pin(PIN_LED_B, Pin.OUT)
 
-btn_A = Pin(PIN_BTN_A, Pin.IN, Pin.PULL_UP)
-btn_B = Pin(PIN_BTN_B, Pin.IN, Pin.PULL_UP)
-btn_X = Pin(PIN_BTN_X, Pin.IN, Pin.PULL_UP)
-btn_Y = Pin(PIN_BTN_Y, Pin.IN, Pin.PULL_UP)
+
+
+class Button:
+    """Active-low push button with trailing-edge debounce.
+
+    A press registers on the first low sample. Release is accepted only once the pin
+    has read high for longer than debounce_ms, so contact bounce on press or release
+    never shows up as a gap in held().
+    """
+
+    def __init__(self, pin_id, debounce_ms=BTN_DEBOUNCE_MS):
+        self.pin = Pin(pin_id, Pin.IN, Pin.PULL_UP)
+        self._debounce_ms = debounce_ms
+        self._down = False
+        self._last_low_ms = 0
+
+    def held(self):
+        """Return True while the button is (debounced) pressed."""
+        now = utime.ticks_ms()
+        if not self.pin.value():
+            self._down = True
+            self._last_low_ms = now
+        elif self._down and utime.ticks_diff(now, self._last_low_ms) > self._debounce_ms:
+            self._down = False
+        return self._down
+
+
+btn_A = Button(PIN_BTN_A)
+btn_B = Button(PIN_BTN_B)
+btn_X = Button(PIN_BTN_X)
+btn_Y = Button(PIN_BTN_Y)
 
 
 def set_led(r=0, g=0, b=0):
@@ -36,12 +65,38 @@ def set_led(r=0, g=0, b=0):
 
 
 def buttons_by_held():
-    """Return True if B+Y are both pressed (active low)."""
-    return not btn_B.value() and not btn_Y.value()
+    """Return True if B+Y are both pressed."""
+    b = btn_B.held()  # sample both every poll (no short-circuit) so each latch stays current
+    y = btn_Y.held()
+    return b and y
+
+
+_go_edge = False  # set from the B/Y falling-edge IRQ; cleared when the chord is re-checked
+
+
+def _on_go_edge(pin):
+    global _go_edge
+    _go_edge = True
 
 
 def wait_for_go():
-    """Blue LED, block until B+Y held."""
+    """Blue LED, block until B+Y held.
+
+    Event-driven: the chord is only re-checked after a falling edge on B or Y, and the
+    CPU sits in idle() (WFI) in between instead of waking every poll period.
+    """
+    global _go_edge
     set_led(b=1)
-    while not buttons_by_held():
-        utime.sleep_ms(10)
\ No newline at end of file
+    _go_edge = True  # check once up front in case B+Y are already held
+    btn_B.pin.irq(handler=_on_go_edge, trigger=Pin.IRQ_FALLING)
+    btn_Y.pin.irq(handler=_on_go_edge, trigger=Pin.IRQ_FALLING)
+    try:
+        while True:
+            if _go_edge:
+                _go_edge = False
+                if buttons_by_held():
+                    return
+            idle()
+    finally:
+        btn_B.pin.irq(handler=None)
+        btn_Y.pin.irq(handler=None)
\ No newline at end of file
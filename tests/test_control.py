@@ -95,6 +95,23 @@ def test_imu_roll_sign_contract(cfg):
     assert core.last_ang_err > 0
 
 
+def test_imu_roll_cache_follows_new_quaternion(cfg):
+    """A new GRV quaternion after an unchanged one must update ang_err (roll cache refresh)."""
+    outer_n = _outer_ticks(cfg)
+    dt = _dt(cfg)
+    core = ControlCore(cfg)
+
+    fresh = ControlCore(cfg)
+    _step_n(fresh, outer_n, *_q_from_phi(25.0), 0.0, dt)
+
+    _step_n(core, outer_n, *_q_from_phi(10.0), 0.0, dt)
+    _step_n(core, outer_n, *_q_from_phi(10.0), 0.0, dt)  # same quaternion: cached roll
+    assert core.last_is_outer
+    _step_n(core, outer_n, *_q_from_phi(25.0), 0.0, dt)
+
+    assert core.last_ang_err == pytest.approx(fresh.last_ang_err)
+
+
 # ---------------------------------------------------------------------------
 # Feedforward direction
 # ---------------------------------------------------------------------------
@@ -59,3 +59,35 @@ def test_ki_zero_integral_stays_zero():
     for _ in range(100):
         pid.compute(10.0, 0.01)
     assert pid._integral == pytest.approx(0.0)
+
+
+def test_d_filter_smooths_measurement_step():
+    """d_cutoff_hz: a measurement step gives a fraction of the raw D, then decays toward zero."""
+    raw = PID(kp=0.0, ki=0.0, kd=1.0)
+    filt = PID(kp=0.0, ki=0.0, kd=1.0, d_cutoff_hz=20.0, dt_nominal=0.01)
+    for pid in (raw, filt):
+        pid.compute(0.0, 0.01, measurement=0.0)
+    out_raw = raw.compute(0.0, 0.01, measurement=1.0)
+    out_step = filt.compute(0.0, 0.01, measurement=1.0)
+    out_hold = filt.compute(0.0, 0.01, measurement=1.0)
+
+    assert out_raw == pytest.approx(-100.0)
+    assert out_raw < out_step < 0.0
+    assert out_step < out_hold < 0.0
+
+
+def test_reset_clears_d_filter():
+    """After reset() the filtered D behaves exactly like a fresh PID's."""
+    def make():
+        return PID(kp=0.0, ki=0.0, kd=1.0, d_cutoff_hz=20.0, dt_nominal=0.01)
+
+    pid = make()
+    pid.compute(0.0, 0.01, measurement=0.0)
+    pid.compute(0.0, 0.01, measurement=1.0)
+    pid.reset()
+    fresh = make()
+
+    assert pid.compute(0.0, 0.01, measurement=1.0) == pytest.approx(0.0, abs=1e-9)
+    fresh.compute(0.0, 0.01, measurement=1.0)
+    assert pid.compute(0.0, 0.01, measurement=2.0) == pytest.approx(
+        fresh.compute(0.0, 0.01, measurement=2.0))